@@ -2,14 +2,38 @@
 import pygame
 import sys
 import random
+from array import array
+
+# NumPy is optional: without it the same flat-54 representation is kept in
+# a compact array('B') buffer with tuple permutation tables
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional too; when present the move gather runs as native code
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Optional compiled move kernel (see cube_ops.pyx / setup_cube_ops.py)
+try:
+    from cube_ops import apply_perm as _c_apply_perm
+except ImportError:
+    _c_apply_perm = None
 
 # -------- Cube representation ----------
-# Each face: 3x3 list of colors (single-letter strings)
-# Faces: U (up), D (down), L (left), R (right), F (front), B (back)
-# Colors: W (white) U, Y (yellow) D, O (orange) L, R (red) R, G (green) F, B (blue) B
+# The whole cube is one flat np.uint8 array of 54 stickers, ordered
+# face * 9 + row * 3 + col (reshape to (6, 3, 3) for the face/row/col view).
+# Faces: U (up), L (left), F (front), R (right), B (back), D (down)
+# Sticker values are color codes 0..5, one per face of the solved cube:
+# 0 = W (white) U, 1 = O (orange) L, 2 = G (green) F,
+# 3 = R (red) R, 4 = B (blue) B, 5 = Y (yellow) D
 
 FACE_ORDER = ['U', 'L', 'F', 'R', 'B', 'D']
-STARTING_COLORS = {'U': 'W', 'D': 'Y', 'L': 'O', 'R': 'R', 'F': 'G', 'B': 'B'}
+FACE_IDX = {'U': 0, 'L': 1, 'F': 2, 'R': 3, 'B': 4, 'D': 5}
+FACE_COLORS = ['W', 'O', 'G', 'R', 'B', 'Y']  # color letter per face id
 
 # color map for pygame
 COLOR_MAP = {
@@ -22,121 +46,191 @@ COLOR_MAP = {
     'X': (30, 30, 30)  # fallback / border
 }
 
+# RGB per color code, for drawing
+COLOR_LIST = [COLOR_MAP[c] for c in FACE_COLORS]
+
 
 def make_solved_cube():
-    cube = {}
-    for f in STARTING_COLORS:
-        cube[f] = [[STARTING_COLORS[f] for _ in range(3)] for _ in range(3)]
-    return cube
+    # face f is filled with color code f
+    if np is not None:
+        return np.repeat(np.arange(6, dtype=np.uint8), 9)
+    # one contiguous 54-byte buffer instead of a tree of list objects
+    return array('B', (i // 9 for i in range(54)))
+
+
+# rotate a 3x3 face matrix clockwise or counterclockwise
+if np is not None:
+    def rotate_face_matrix(face_mat, clockwise=True):
+        # np.rot90 rotates counterclockwise for positive k
+        return np.rot90(face_mat, -1 if clockwise else 1)
+else:
+    def rotate_face_matrix(face_mat, clockwise=True):
+        # hand-unrolled 3x3 rotation: fixed shape, so explicit indexing beats
+        # the generic zip/reversed iterator dance
+        m = face_mat
+        if clockwise:
+            return [[m[2][0], m[1][0], m[0][0]],
+                    [m[2][1], m[1][1], m[0][1]],
+                    [m[2][2], m[1][2], m[0][2]]]
+        return [[m[0][2], m[1][2], m[2][2]],
+                [m[0][1], m[1][1], m[2][1]],
+                [m[0][0], m[1][0], m[2][0]]]
+
+
+# For each face, the four edge strips on adjacent faces that cycle when the
+# face rotates, in clockwise order. Each entry is (face_id, index, is_row,
+# reverse_flag); is_row picks cube[f, idx, :] vs cube[f, :, idx], and
+# reverse_flag says the strip is traversed backwards relative to the cycle.
+ROW, COL = True, False
+EDGE_CYCLES = [
+    [  # U
+        (FACE_IDX['B'], 0, ROW, False),
+        (FACE_IDX['R'], 0, ROW, False),
+        (FACE_IDX['F'], 0, ROW, False),
+        (FACE_IDX['L'], 0, ROW, False)
+    ],
+    [  # L
+        (FACE_IDX['U'], 0, COL, False),
+        (FACE_IDX['F'], 0, COL, False),
+        (FACE_IDX['D'], 0, COL, False),
+        (FACE_IDX['B'], 2, COL, True)
+    ],
+    [  # F
+        (FACE_IDX['U'], 2, ROW, False),
+        (FACE_IDX['R'], 0, COL, True),  # note orientation flips
+        (FACE_IDX['D'], 0, ROW, True),
+        (FACE_IDX['L'], 2, COL, False)
+    ],
+    [  # R
+        (FACE_IDX['U'], 2, COL, False),
+        (FACE_IDX['B'], 0, COL, True),
+        (FACE_IDX['D'], 2, COL, False),
+        (FACE_IDX['F'], 2, COL, False)
+    ],
+    [  # B
+        (FACE_IDX['U'], 0, ROW, True),
+        (FACE_IDX['L'], 0, COL, True),
+        (FACE_IDX['D'], 2, ROW, False),
+        (FACE_IDX['R'], 2, COL, False)
+    ],
+    [  # D
+        (FACE_IDX['F'], 2, ROW, False),
+        (FACE_IDX['R'], 2, ROW, False),
+        (FACE_IDX['B'], 2, ROW, False),
+        (FACE_IDX['L'], 2, ROW, False)
+    ]
+]
 
 
-# rotate a 3x3 matrix clockwise or counterclockwise
-def rotate_face_matrix(face_mat, clockwise=True):
-    # clockwise rotation of 3x3
-    if clockwise:
-        return [list(reversed(col)) for col in zip(*face_mat)]
-    else:
-        # counterclockwise
-        return [list(col) for col in zip(*reversed(face_mat))][::-1]
-
-
-# helper: get row or column
-def get_row(face, idx):
-    return face[idx][:]
-
-
-def set_row(face, idx, values):
-    face[idx] = values[:]
-
-
-def get_col(face, idx):
-    return [face[r][idx] for r in range(3)]
-
-
-def set_col(face, idx, values):
-    for r in range(3):
-        face[r][idx] = values[r]
-
-
-# Implement face rotations updating adjacent faces.
-# The mapping below is defined in standard cube orientation.
-def rotate_cube_face(cube, face_name, clockwise=True):
-    # first rotate the face itself
-    cube[face_name] = rotate_face_matrix(cube[face_name], clockwise)
-
-    # now move edge stickers among adjacent faces
-    # For each face, define the four affected faces and which rows/cols are involved,
-    # in order so they rotate cyclically when the face rotates clockwise.
-    # Each entry is (adj_face, 'row'/'col', index, reverse_flag)
-    # reverse_flag indicates whether to reverse the sequence when moving.
-
-    if face_name == 'U':
-        seq = [
-            ('B', 'row', 0, False),
-            ('R', 'row', 0, False),
-            ('F', 'row', 0, False),
-            ('L', 'row', 0, False)
-        ]
-    elif face_name == 'D':
-        seq = [
-            ('F', 'row', 2, False),
-            ('R', 'row', 2, False),
-            ('B', 'row', 2, False),
-            ('L', 'row', 2, False)
-        ]
-    elif face_name == 'F':
-        seq = [
-            ('U', 'row', 2, False),
-            ('R', 'col', 0, True),  # note orientation flips
-            ('D', 'row', 0, True),
-            ('L', 'col', 2, False)
-        ]
-    elif face_name == 'B':
-        seq = [
-            ('U', 'row', 0, True),
-            ('L', 'col', 0, True),
-            ('D', 'row', 2, False),
-            ('R', 'col', 2, False)
-        ]
-    elif face_name == 'L':
-        seq = [
-            ('U', 'col', 0, False),
-            ('F', 'col', 0, False),
-            ('D', 'col', 0, False),
-            ('B', 'col', 2, True)
-        ]
-    elif face_name == 'R':
-        seq = [
-            ('U', 'col', 2, False),
-            ('B', 'col', 0, True),
-            ('D', 'col', 2, False),
-            ('F', 'col', 2, False)
-        ]
-    else:
-        return  # unknown face
+# Reference move implementation on the (6, 3, 3) view, defined in standard
+# cube orientation. Only used at import time to build the permutation tables.
+def _rotate_cube_face_ref(cube, fid, clockwise=True):
+    # rotate the face itself
+    cube[fid] = rotate_face_matrix(cube[fid], clockwise)
 
-    # Read current sequences
-    parts = []
-    for (af, typ, idx, rev) in seq:
-        if typ == 'row':
-            p = get_row(cube[af], idx)
+    # cycle the four edge strips in one roll: read them into a (4, 3) buffer,
+    # shift along axis 0, write back
+    seq = EDGE_CYCLES[fid]
+    strips = np.empty((4, 3), dtype=np.uint8)
+    for i, (f, idx, is_row, rev) in enumerate(seq):
+        p = cube[f, idx, :] if is_row else cube[f, :, idx]
+        strips[i] = p[::-1] if rev else p
+
+    strips = np.roll(strips, 1 if clockwise else -1, axis=0)
+
+    for (f, idx, is_row, rev), data in zip(seq, strips):
+        out = data[::-1] if rev else data
+        if is_row:
+            cube[f, idx, :] = out
         else:
-            p = get_col(cube[af], idx)
-        parts.append(list(reversed(p)) if rev else p[:])
+            cube[f, :, idx] = out
+
+
+# Pure-Python counterpart of the reference move, on a list of six 3x3 face
+# matrices. Column reads/writes are unrolled since the shape is fixed.
+def _rotate_cube_face_ref_py(cube, fid, clockwise=True):
+    cube[fid] = rotate_face_matrix(cube[fid], clockwise)
+
+    seq = EDGE_CYCLES[fid]
+    # rows can be taken by reference and handed on without defensive copies:
+    # every strip in the cycle is rewritten below, so no original row is ever
+    # aliased from two faces at once
+    parts = []
+    for (f, idx, is_row, rev) in seq:
+        face = cube[f]
+        p = face[idx] if is_row else [face[0][idx], face[1][idx], face[2][idx]]
+        # [::-1] copies in one C-level step, no iterator protocol involved
+        parts.append(p[::-1] if rev else p)
 
-    # rotate them: if clockwise, shift right by 1; else shift left by 1
     if clockwise:
         parts = [parts[-1]] + parts[:-1]
     else:
         parts = parts[1:] + [parts[0]]
 
-    # write back
-    for (af, typ, idx, rev), data in zip(seq, parts):
-        out = list(reversed(data)) if rev else data[:]
-        if typ == 'row':
-            set_row(cube[af], idx, out)
+    for (f, idx, is_row, rev), data in zip(seq, parts):
+        out = data[::-1] if rev else data
+        face = cube[f]
+        if is_row:
+            face[idx] = out
         else:
-            set_col(cube[af], idx, out)
+            face[0][idx], face[1][idx], face[2][idx] = out
+
+
+# Per-move permutation tables: PERMS[face_id][0] (clockwise) and
+# PERMS[face_id][1] (counterclockwise) map the flat 54-sticker cube to its
+# post-move state, so applying a move is a single gather. Built once at
+# import by running the reference move on an identity-labeled cube (0..53).
+def _build_perms():
+    if np is not None:
+        perms = np.empty((6, 2, 54), dtype=np.int8)
+        for fid in range(6):
+            for d, clockwise in enumerate((True, False)):
+                ident = np.arange(54, dtype=np.uint8).reshape(6, 3, 3)
+                _rotate_cube_face_ref(ident, fid, clockwise)
+                perms[fid, d] = ident.ravel()
+        return perms
+
+    perms = []
+    for fid in range(6):
+        pair = []
+        for clockwise in (True, False):
+            ident = [[[f * 9 + r * 3 + c for c in range(3)]
+                      for r in range(3)] for f in range(6)]
+            _rotate_cube_face_ref_py(ident, fid, clockwise)
+            pair.append(tuple(v for face in ident for row in face for v in row))
+        perms.append(tuple(pair))
+    return perms
+
+
+PERMS = _build_perms()
+
+
+# Apply a precomputed 54-element permutation to the flat cube in place.
+# Fastest available backend wins: compiled Cython kernel, Numba-jitted
+# loop, NumPy gather, or a plain list comprehension.
+if np is not None and _c_apply_perm is not None:
+    apply_perm = _c_apply_perm
+elif np is not None and njit is not None:
+    @njit(cache=True)
+    def _gather(cube, perm):
+        out = np.empty_like(cube)
+        for i in range(54):
+            out[i] = cube[perm[i]]
+        return out
+
+    def apply_perm(cube, perm):
+        cube[:] = _gather(cube, perm)
+elif np is not None:
+    def apply_perm(cube, perm):
+        cube[:] = cube[perm]
+else:
+    def apply_perm(cube, perm):
+        cube[:] = array('B', (cube[j] for j in perm))
+
+
+def rotate_cube_face(cube, face_id, clockwise=True):
+    # face_id is an integer index; callers translate letters via FACE_IDX
+    apply_perm(cube, PERMS[face_id][0 if clockwise else 1])
 
 
 # ---------- Pygame UI ----------
@@ -144,50 +238,118 @@ CELL = 40
 PADDING = 10
 MARGIN = 20
 
-# layout for the 2D net (row, col) for each face, measured in cells
-NET_POS = {
-    'U': (0, 1),
-    'L': (1, 0),
-    'F': (1, 1),
-    'R': (1, 2),
-    'B': (1, 3),
-    'D': (2, 1)
-}
-
-
-def draw_cube_net(screen, cube, top_left):
-    tx, ty = top_left
-    for face, (nr, nc) in NET_POS.items():
-        fx = tx + nc * (CELL * 3 + PADDING)
-        fy = ty + nr * (CELL * 3 + PADDING)
-        # draw 3x3 squares
+# layout for the 2D net (row, col) per face id, measured in cells
+NET_POS = [
+    (0, 1),  # U
+    (1, 0),  # L
+    (1, 1),  # F
+    (1, 2),  # R
+    (1, 3),  # B
+    (2, 1)   # D
+]
+
+# pixel size of the whole net (4 columns x 3 rows of faces)
+NET_W = 3 * (CELL * 3 + PADDING) + 3 * CELL
+NET_H = 2 * (CELL * 3 + PADDING) + 3 * CELL
+
+BG_COLOR = (200, 200, 200)
+
+
+# Net pixel positions, computed once at load: STICKER_POS[face*9 + row*3 + col]
+# is a sticker's top-left corner inside the net surface, BORDER_POS[face] the
+# corner of that face's border. Keeps all layout arithmetic out of the redraw.
+def _build_positions():
+    sticker_pos = [None] * 54
+    border_pos = [None] * 6
+    for fid, (nr, nc) in enumerate(NET_POS):
+        fx = nc * (CELL * 3 + PADDING)
+        fy = nr * (CELL * 3 + PADDING)
+        border_pos[fid] = (fx, fy)
         for r in range(3):
             for c in range(3):
-                color_char = cube[face][r][c]
-                color = COLOR_MAP.get(color_char, COLOR_MAP['X'])
-                rect = pygame.Rect(fx + c * CELL, fy + r * CELL, CELL - 1, CELL - 1)
-                pygame.draw.rect(screen, color, rect)
-        # draw face border
-        border_rect = pygame.Rect(fx, fy, 3 * CELL - 1, 3 * CELL - 1)
-        pygame.draw.rect(screen, (20, 20, 20), border_rect, 2)
+                sticker_pos[fid * 9 + r * 3 + c] = (fx + c * CELL, fy + r * CELL)
+    return sticker_pos, border_pos
+
+
+STICKER_POS, BORDER_POS = _build_positions()
+
+
+# Sticker tiles (one solid surface per color code) and a hollow border tile,
+# built on first draw since surfaces need pygame to be initialized.
+_TILES = None
+_BORDER_TILE = None
+
+
+def _make_tiles():
+    global _TILES, _BORDER_TILE
+    _TILES = []
+    for color in COLOR_LIST:
+        # .convert() matches the display pixel format so blits are plain copies
+        tile = pygame.Surface((CELL - 1, CELL - 1)).convert()
+        tile.fill(color)
+        _TILES.append(tile)
+    _BORDER_TILE = pygame.Surface((3 * CELL - 1, 3 * CELL - 1), pygame.SRCALPHA)
+    pygame.draw.rect(_BORDER_TILE, (20, 20, 20), _BORDER_TILE.get_rect(), 2)
+    _BORDER_TILE = _BORDER_TILE.convert_alpha()
+
+
+# Render the full net into `surface` (an off-screen cache the caller blits
+# every frame; only redrawn when the cube actually changes).
+def draw_cube_net(surface, cube):
+    if _TILES is None:
+        _make_tiles()
+    surface.fill(BG_COLOR)
+    # batch all 54 stickers plus the 6 face borders into one blits() call
+    blit_list = [(_TILES[cube[i]], STICKER_POS[i]) for i in range(54)]
+    blit_list += [(_BORDER_TILE, pos) for pos in BORDER_POS]
+    surface.blits(blit_list, doreturn=False)
 
 
 def scramble_cube(cube, moves=25):
-    faces = ['U', 'D', 'L', 'R', 'F', 'B']
-    for _ in range(moves):
-        f = random.choice(faces)
-        cw = random.choice([True, False])
-        rotate_cube_face(cube, f, clockwise=cw)
+    # sample every move id (face * 2 + direction) in one RNG call, then fold
+    # the whole sequence into one 54-element permutation and apply it to the
+    # cube in a single gather
+    move_ids = random.choices(range(12), k=moves)
+    if np is not None:
+        # int8 like the tables themselves, so any apply_perm backend takes it
+        perm = np.arange(54, dtype=np.int8)
+        for mid in move_ids:
+            perm = perm[PERMS[mid >> 1][mid & 1]]
+    else:
+        perm = list(range(54))
+        for mid in move_ids:
+            table = PERMS[mid >> 1][mid & 1]
+            perm = [perm[j] for j in table]
+    apply_perm(cube, perm)
 
 
 def is_solved(cube):
-    for f in cube:
-        col = cube[f][0][0]
-        for r in range(3):
-            for c in range(3):
-                if cube[f][r][c] != col:
-                    return False
-    return True
+    # every sticker matches its face's center sticker; centers never move,
+    # so this holds for any color scheme
+    if np is not None:
+        faces = cube.reshape(6, 9)
+        return bool((faces == faces[:, 4:5]).all())
+    # compare each face's 9 bytes against its center byte in one slice compare
+    raw = cube.tobytes()
+    return all(raw[f * 9:f * 9 + 9] == raw[f * 9 + 4:f * 9 + 5] * 9
+               for f in range(6))
+
+
+# Solver support: pack the 54 sticker codes into one Python int (one byte
+# per sticker) so states can be dropped straight into sets and dicts. One
+# int hash is far cheaper than hashing a tuple-of-tuples, and a visited
+# entry shrinks to a couple of machine words instead of a tree of objects.
+def encode(cube):
+    if np is not None:
+        return int.from_bytes(cube.tobytes(), 'little')
+    return int.from_bytes(bytes(cube), 'little')
+
+
+def decode(value):
+    raw = value.to_bytes(54, 'little')
+    if np is not None:
+        return np.frombuffer(raw, dtype=np.uint8).copy()
+    return array('B', raw)
 
 
 def main():
@@ -216,66 +378,95 @@ def main():
         " Esc or Q : Quit"
     ]
 
-    clock = pygame.time.Clock()
+    # the instructions never change: render the panel once at startup
+    x0 = 3 * (CELL * 3 + PADDING) + MARGIN + 20
+    y0 = MARGIN
+    instructions_surf = pygame.Surface((screen_w - x0, len(instructions) * 22),
+                                       pygame.SRCALPHA)
+    for i, line in enumerate(instructions):
+        txt = font.render(line, True, (30, 30, 30))
+        instructions_surf.blit(txt, (0, i * 22))
+    # match the display pixel format so the per-frame blits are plain copies
+    instructions_surf = instructions_surf.convert_alpha()
+
+    # off-screen cache for the net; redrawn only when the cube changes
+    net_surface = pygame.Surface((NET_W, NET_H)).convert()
+    net_dirty = True
+
+    net_rect = pygame.Rect(MARGIN, MARGIN, NET_W, NET_H)
+    message_rect = pygame.Rect(0, screen_h - 40, screen_w, 40)
+
     running = True
     message = "Welcome! Press S to scramble."
+    last_message = None
+    first_frame = True
+    needs_redraw = True
 
+    # Nothing animates, so there is no fixed frame rate: the loop blocks in
+    # pygame.event.wait() and only redraws after an event changed something.
     while running:
-        screen.fill((200, 200, 200))
-        # draw net
-        net_top_left = (MARGIN, MARGIN)
-        draw_cube_net(screen, cube, net_top_left)
-
-        # draw instructions
-        x0 = 3 * (CELL * 3 + PADDING) + MARGIN + 20
-        y0 = MARGIN
-        for i, line in enumerate(instructions):
-            txt = font.render(line, True, (30, 30, 30))
-            screen.blit(txt, (x0, y0 + i * 22))
-
-        # draw message
-        msg_surf = bigfont.render(message, True, (10, 10, 10))
-        screen.blit(msg_surf, (MARGIN, screen_h - 40))
-
-        for event in pygame.event.get():
+        if needs_redraw:
+            needs_redraw = False
+
+            # collect the screen regions that actually changed
+            dirty_rects = []
+            if net_dirty:
+                draw_cube_net(net_surface, cube)
+                net_dirty = False
+                dirty_rects.append(net_rect)
+            if message != last_message:
+                last_message = message
+                # rasterize the message only when its text changes
+                msg_surf = bigfont.render(message, True, (10, 10, 10)).convert_alpha()
+                dirty_rects.append(message_rect)
+
+            # redrawing the back buffer is cheap (cached surfaces); only the
+            # dirty regions get pushed to the display below
+            screen.fill(BG_COLOR)
+            screen.blit(net_surface, (MARGIN, MARGIN))
+            # net overlaps the instructions panel, so blit the panel after it
+            screen.blit(instructions_surf, (x0, y0))
+            screen.blit(msg_surf, (MARGIN, screen_h - 40))
+
+            if first_frame:
+                # push the whole screen once, then only dirty regions
+                pygame.display.flip()
+                first_frame = False
+            else:
+                pygame.display.update(dirty_rects)
+
+        # block until something happens, then drain the queue
+        events = [pygame.event.wait()] + pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             elif event.type == pygame.KEYDOWN:
                 ch = event.unicode
-                # allow uppercase detection via shift: event.unicode respects case
-                if ch in ('U', 'u'):
-                    rotate_cube_face(cube, 'U', clockwise=(ch == 'U'))
-                    message = f"Rotated U {'CW' if ch == 'U' else 'CCW'}"
-                elif ch in ('D', 'd'):
-                    rotate_cube_face(cube, 'D', clockwise=(ch == 'D'))
-                    message = f"Rotated D {'CW' if ch == 'D' else 'CCW'}"
-                elif ch in ('L', 'l'):
-                    rotate_cube_face(cube, 'L', clockwise=(ch == 'L'))
-                    message = f"Rotated L {'CW' if ch == 'L' else 'CCW'}"
-                elif ch in ('R', 'r'):
-                    rotate_cube_face(cube, 'R', clockwise=(ch == 'R'))
-                    message = f"Rotated R {'CW' if ch == 'R' else 'CCW'}"
-                elif ch in ('F', 'f'):
-                    rotate_cube_face(cube, 'F', clockwise=(ch == 'F'))
-                    message = f"Rotated F {'CW' if ch == 'F' else 'CCW'}"
-                elif ch in ('B', 'b'):
-                    rotate_cube_face(cube, 'B', clockwise=(ch == 'B'))
-                    message = f"Rotated B {'CW' if ch == 'B' else 'CCW'}"
+                # event.unicode respects case, so shift picks the direction;
+                # translate the face letter to its id once, right here
+                fid = FACE_IDX.get(ch.upper())
+                if fid is not None:
+                    cw = ch.isupper()
+                    rotate_cube_face(cube, fid, clockwise=cw)
+                    message = f"Rotated {ch.upper()} {'CW' if cw else 'CCW'}"
+                    net_dirty = True
                 else:
                     key = event.key
                     if key == pygame.K_s:
                         scramble_cube(cube, moves=25)
                         message = "Scrambled"
+                        net_dirty = True
                     elif key == pygame.K_SPACE:
                         cube = make_solved_cube()
                         message = "Reset to solved"
+                        net_dirty = True
                     elif key == pygame.K_c:
                         message = "Solved!" if is_solved(cube) else "Not solved yet."
                     elif key in (pygame.K_ESCAPE, pygame.K_q):
                         running = False
 
-        pygame.display.flip()
-        clock.tick(30)
+        if net_dirty or message != last_message:
+            needs_redraw = True
 
     pygame.quit()
     sys.exit()
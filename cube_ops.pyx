@@ -0,0 +1,16 @@
+# cython: boundscheck=False, wraparound=False
+# Native move kernel for the flat 54-sticker cube in Rubic_Cube_2D.py.
+# Build in place with:
+#   python setup_cube_ops.py build_ext --inplace
+# The app falls back to the Numba/NumPy/pure-Python kernels when this
+# extension is not built.
+
+
+cpdef void apply_perm(unsigned char[::1] state, signed char[::1] perm):
+    # gather the permuted stickers through a stack buffer, then copy back
+    cdef unsigned char tmp[54]
+    cdef int i
+    for i in range(54):
+        tmp[i] = state[perm[i]]
+    for i in range(54):
+        state[i] = tmp[i]
@@ -0,0 +1,6 @@
+# Builds the optional native move kernel for Rubic_Cube_2D.py:
+#   python setup_cube_ops.py build_ext --inplace
+from setuptools import setup
+from Cython.Build import cythonize
+
+setup(name="cube_ops", ext_modules=cythonize("cube_ops.pyx"))